@@ -11,9 +11,9 @@ import warnings
 
 import numpy as np
 import pandas as pd
-import scipy as sp
-from scipy.optimize import minimize
-from scipy.stats import chi2, pearsonr
+from scipy.linalg import eigh, get_lapack_funcs
+from scipy.optimize import Bounds, minimize
+from scipy.stats import chi2
 from sklearn.base import BaseEstimator, TransformerMixin
 from sklearn.decomposition import PCA, TruncatedSVD
 from sklearn.utils import check_array
@@ -23,7 +23,7 @@ from sklearn.utils.validation import check_is_fitted
 from .rotator import OBLIQUE_ROTATIONS, POSSIBLE_ROTATIONS, Rotator
 from .utils import corr, impute_values, partial_correlations, smc
 
-POSSIBLE_SVDS_PRINCIPAL = ['randomized', 'lapack']
+POSSIBLE_SVDS_PRINCIPAL = ['randomized', 'lapack', 'auto']
 POSSIBLE_SVDS_PCA = ['randomized', 'arpack', 'full', 'auto']
 POSSIBLE_SVDS_LSA = ['randomized', 'arpack']
 
@@ -65,17 +65,18 @@ def calculate_kmo(x):
     np.fill_diagonal(x_corr, 0)
     np.fill_diagonal(partial_corr, 0)
 
-    partial_corr = partial_corr**2
-    x_corr = x_corr**2
+    partial_corr = partial_corr * partial_corr
+    x_corr = x_corr * x_corr
 
     # calculate KMO per item
     partial_corr_sum = np.sum(partial_corr, axis=0)
     corr_sum = np.sum(x_corr, axis=0)
     kmo_per_item = corr_sum / (corr_sum + partial_corr_sum)
 
-    # calculate KMO overall
-    corr_sum_total = np.sum(x_corr)
-    partial_corr_sum_total = np.sum(partial_corr)
+    # calculate KMO overall; the totals are just the
+    # sums of the per-item sums computed above
+    corr_sum_total = np.sum(corr_sum)
+    partial_corr_sum_total = np.sum(partial_corr_sum)
     kmo_total = corr_sum_total / (corr_sum_total + partial_corr_sum_total)
     return kmo_per_item, kmo_total
 
@@ -110,8 +111,17 @@ def calculate_bartlett_sphericity(x):
     n, p = x.shape
     x_corr = corr(x)
 
-    corr_det = np.linalg.det(x_corr)
-    statistic = -np.log(corr_det) * (n - 1 - (2 * p + 5) / 6)
+    # use the log determinant directly, since the determinant
+    # itself can underflow to zero for a large number of variables;
+    # a singular matrix gives a log determinant of -inf (and so an
+    # infinite statistic), but if the determinant is negative, the
+    # matrix is not a valid correlation matrix and the log is undefined
+    sign, corr_logdet = np.linalg.slogdet(x_corr)
+    if sign < 0:
+        warnings.warn('The determinant of the correlation matrix is '
+                      'negative, so the statistic cannot be calculated.')
+        corr_logdet = np.nan
+    statistic = -corr_logdet * (n - 1 - (2 * p + 5) / 6)
     degrees_of_freedom = p * (p - 1) / 2
     p_value = chi2.sf(statistic, degrees_of_freedom)
     return statistic, p_value
@@ -185,6 +195,9 @@ class FactorAnalyzer(BaseEstimator, TransformerMixin):
         function from scikit-learn. The latter should only
         be used if the number of columns is greater than or
         equal to the number of rows in in the dataset. 
+        If 'auto' and ``method='principal'``, use 'randomized'
+        when the number of factors is less than 10% of the
+        smaller dimension of the data, and 'lapack' otherwise.
         Defaults to 'randomized'
     rotation_kwargs, optional
         Additional key word arguments
@@ -280,6 +293,10 @@ class FactorAnalyzer(BaseEstimator, TransformerMixin):
         self.rotation_matrix_ = None
         self.weights_ = None
 
+        # cached eigenvalues, computed on the first
+        # call to `get_eigenvalues()` after fitting
+        self._eigenvalues = None
+
     def _arg_checker(self):
         """
         Check the input parameters to make sure they're properly formattted.
@@ -322,7 +339,59 @@ class FactorAnalyzer(BaseEstimator, TransformerMixin):
         self.rotation_kwargs = {} if self.rotation_kwargs is None else self.rotation_kwargs
 
     @staticmethod
-    def _fit_uls_objective(psi, corr_mtx, n_factors):
+    def _top_eigh(mtx, n_factors, overwrite_a=False):
+        """
+        Calculate the largest `n_factors` eigenvalues and
+        eigenvectors of a symmetric matrix, calling LAPACK's
+        `syevr` directly. This is called on every evaluation
+        of the ULS objective function, so we skip the argument
+        handling in `scipy.linalg.eigh()`.
+
+        Parameters
+        ----------
+        mtx : numpy array
+            The symmetric matrix.
+        n_factors : int
+            The number of eigenpairs to compute.
+        overwrite_a : bool, optional
+            Whether LAPACK may overwrite `mtx`.
+            Defaults to False.
+
+        Returns
+        -------
+        values : numpy array
+            The eigenvalues, in descending order.
+        vectors : numpy array
+            The eigenvectors, in the same order.
+
+        Raises
+        ------
+        np.linalg.LinAlgError
+            If the eigendecomposition does not converge.
+        """
+        n_rows = mtx.shape[0]
+        syevr, = get_lapack_funcs(('syevr',), (mtx,))
+
+        # `mtx` is symmetric, so its transpose is the same matrix
+        # in Fortran order, which LAPACK can use without a copy
+        values, vectors, _, _, info = syevr(mtx.T,
+                                            compute_v=1,
+                                            range='I',
+                                            lower=1,
+                                            il=max(n_rows - n_factors, 0) + 1,
+                                            iu=n_rows,
+                                            overwrite_a=overwrite_a)
+        if info != 0:
+            raise np.linalg.LinAlgError('The eigendecomposition did not '
+                                        'converge (info={}).'.format(info))
+
+        # the eigenvalues are returned in ascending order, and only
+        # the first `n_eigen` values are filled in, so we reverse them
+        n_eigen = vectors.shape[1]
+        return values[:n_eigen][::-1], vectors[:, ::-1]
+
+    @staticmethod
+    def _fit_uls_objective(psi, corr_mtx, n_factors, off_diag_sum_squares=None):
         """
         The objective function passed to `minimize()` for ULS.
 
@@ -334,45 +403,53 @@ class FactorAnalyzer(BaseEstimator, TransformerMixin):
             The correlation matrix.
         n_factors : int
             The number of factors to select.
+        off_diag_sum_squares : float or None, optional
+            The sum of squares of the off-diagonal elements
+            of the correlation matrix. These do not depend
+            on `psi`, so this can be calculated once before
+            optimization. If None, it will be calculated here.
+            Defaults to None.
 
         Returns
         -------
         error : float
             The scalar error calculated from the residuals
             of the loading matrix.
+        gradient : numpy array
+            The gradient of the error with respect to `psi`.
         """
+        if off_diag_sum_squares is None:
+            off_diag_sum_squares = (np.sum(corr_mtx * corr_mtx) -
+                                    np.sum(np.diag(corr_mtx)**2))
+
         np.fill_diagonal(corr_mtx, 1 - psi)
 
-        # get the eigen values and vectors for n_factors
-        values, vectors = sp.linalg.eigh(corr_mtx)
-        values = values[::-1]
+        # get the eigen values and vectors for n_factors; we only
+        # compute the largest `n_factors` eigenpairs, not all of them
+        values, vectors = FactorAnalyzer._top_eigh(corr_mtx, n_factors)
 
         # this is a bit of a hack, borrowed from R's `fac()` function;
         # if values are smaller than the smallest representable positive
         # number * 100, set them to that number instead.
-        values = np.maximum(values, np.finfo(float).eps * 100)
-
-        # sort the values and vectors in ascending order
-        values = values[:n_factors]
-        vectors = vectors[:, ::-1][:, :n_factors]
-
-        # calculate the loadings
-        if n_factors > 1:
-            loadings = np.dot(vectors, np.diag(np.sqrt(values)))
-        else:
-            loadings = vectors * np.sqrt(values[0])
-
-        # calculate the error from the loadings model
-        model = np.dot(loadings, loadings.T)
-
-        # note that in a more recent version of the `fa()` source
-        # code on GitHub, the minres objective function only sums the
-        # lower triangle of the residual matrix; this could be
-        # implemented here using `np.tril()` when this change is
-        # merged into the stable version of `psych`.
-        residual = (corr_mtx - model)**2
-        error = sp.sum(residual)
-        return error
+        model_values = np.maximum(values, np.finfo(float).eps * 100)
+
+        # calculate the error from the loadings model; since the model is
+        # `V diag(w) V'`, where the columns of V are eigenvectors of the
+        # correlation matrix, its squared residual norm reduces to
+        # `||R||^2 - 2 * sum(w * values) + sum(w^2)`, so we never have
+        # to form the model matrix itself; moreover, only the diagonal
+        # of R, `1 - psi`, changes between calls.
+        diag_values = 1 - psi
+        error = (off_diag_sum_squares + np.sum(diag_values * diag_values) -
+                 2 * np.sum(model_values * values) +
+                 np.sum(model_values * model_values))
+
+        # the gradient is -2 times the diagonal of the residual matrix;
+        # passing it to `minimize()` saves the optimizer from estimating
+        # it with one extra call to this function per variable
+        model_diag = np.sum(vectors * vectors * model_values, axis=1)
+        gradient = -2 * (diag_values - model_diag)
+        return error, gradient
 
     @staticmethod
     def _normalize_uls(solution, corr_mtx, n_factors):
@@ -396,16 +473,12 @@ class FactorAnalyzer(BaseEstimator, TransformerMixin):
         """
         np.fill_diagonal(corr_mtx, 1 - solution)
 
-        # get the eigenvalues and vectors for n_factors
-        values, vectors = np.linalg.eigh(corr_mtx)
-
-        # sort the values and vectors in ascending order
-        values = values[::-1][:n_factors]
-        vectors = vectors[:, ::-1][:, :n_factors]
+        # get the largest eigenvalues and vectors for n_factors
+        values, vectors = FactorAnalyzer._top_eigh(corr_mtx, n_factors)
 
         # calculate loadings
         # if values are smaller than 0, set them to zero
-        loadings = np.dot(vectors, np.diag(np.sqrt(np.maximum(values, 0))))
+        loadings = vectors * np.sqrt(np.maximum(values, 0))
         return loadings
 
     @staticmethod
@@ -427,28 +500,37 @@ class FactorAnalyzer(BaseEstimator, TransformerMixin):
         error : float
             The scalar error calculated from the residuals
             of the loading matrix.
+        gradient : numpy array
+            The gradient of the error with respect to `psi`.
 
         Note
         ----
-        The ML objective is based on the `factanal()` function
-        from R's `stats` package. It may generate results different
+        The ML objective and its gradient are based on the `factanal()`
+        function from R's `stats` package. It may generate results different
         from the `fa()` function in `psych`.
 
         References
         ----------
         [1] https://github.com/SurajGupta/r-source/blob/master/src/library/stats/R/factanal.R
         """
-        sc = np.diag(1 / np.sqrt(psi))
-        sstar = np.dot(np.dot(sc, corr_mtx), sc)
+        sc = 1 / np.sqrt(psi)
+        sstar = corr_mtx * np.outer(sc, sc)
 
         # get the eigenvalues and eigenvectors for n_factors
-        values, _ = np.linalg.eigh(sstar)
-        values = values[::-1][n_factors:]
+        values, vectors = eigh(sstar, driver='evd', overwrite_a=True, check_finite=False)
+        values = values[::-1]
+        vectors = vectors[:, ::-1][:, :n_factors]
 
         # calculate the error
-        error = -(np.sum(np.log(values) - values) -
+        error = -(np.sum(np.log(values[n_factors:]) - values[n_factors:]) -
                   n_factors + corr_mtx.shape[0])
-        return error
+
+        # calculate the gradient, as in R's `FAgr()`
+        loadings = vectors * np.sqrt(np.maximum(values[:n_factors] - 1, 0))
+        loadings = np.sqrt(psi)[:, np.newaxis] * loadings
+        residual_diag = np.sum(loadings * loadings, axis=1) + psi - np.diag(corr_mtx)
+        gradient = residual_diag / psi**2
+        return error, gradient
 
     @staticmethod
     def _normalize_ml(solution, corr_mtx, n_factors):
@@ -469,22 +551,18 @@ class FactorAnalyzer(BaseEstimator, TransformerMixin):
         loadings : numpy array
             The factor loading matrix
         """
-        sc = np.diag(1 / np.sqrt(solution))
-        sstar = np.dot(np.dot(sc, corr_mtx), sc)
+        sc = 1 / np.sqrt(solution)
+        sstar = corr_mtx * np.outer(sc, sc)
 
-        # get the eigenvalues for n_factors
-        values, vectors = np.linalg.eigh(sstar)
-
-        # sort the values and vectors in ascending order
-        values = values[::-1][:n_factors]
-        vectors = vectors[:, ::-1][:, :n_factors]
+        # get the largest eigenvalues and vectors for n_factors
+        values, vectors = FactorAnalyzer._top_eigh(sstar, n_factors, overwrite_a=True)
 
         values = np.maximum(values - 1, 0)
 
         # get the loadings
-        loadings = np.dot(vectors, np.diag(np.sqrt(values)))
+        loadings = vectors * np.sqrt(values)
 
-        return np.dot(np.diag(np.sqrt(solution)), loadings)
+        return np.sqrt(solution)[:, np.newaxis] * loadings
 
     def _fit_pca(self, X):
         """
@@ -501,7 +579,7 @@ class FactorAnalyzer(BaseEstimator, TransformerMixin):
         loadings : numpy array
             The factor loadings matrix.
         """
-        X = X.copy().astype(float)
+        X = X.astype(float)
 
         # if the number of rows is less than the number of columns,
         # warn the user that the number of factors will be constrained
@@ -532,7 +610,7 @@ class FactorAnalyzer(BaseEstimator, TransformerMixin):
         loadings : numpy array
             The factor loadings matrix.
         """
-        X = X.copy().astype(float)
+        X = X.astype(float)
 
         # if the number of rows is less than the number of columns,
         # warn the user that the number of factors will be constrained
@@ -564,7 +642,6 @@ class FactorAnalyzer(BaseEstimator, TransformerMixin):
             The factor loadings matrix.
         """
         # standardize the data
-        X = X.copy()
         X = (X - X.mean(0)) / X.std(0)
 
         # if the number of rows is less than the number of columns,
@@ -575,15 +652,26 @@ class FactorAnalyzer(BaseEstimator, TransformerMixin):
                           'constrained to min(n_samples, n_features)'
                           '={}.'.format(min(nrows, ncols)))
 
+        # the randomized SVD only pays off when we need
+        # a small number of the singular vectors
+        svd_method = self.svd_method
+        if svd_method == 'auto':
+            svd_method = 'randomized' if self.n_factors < 0.1 * min(nrows, ncols) else 'lapack'
+
         # perform the randomized singular value decomposition
-        if self.svd_method == 'randomized':
+        if svd_method == 'randomized':
             U, S, V = randomized_svd(X, self.n_factors)
-        # otherwise, perform the full SVD assuming self.svd_method == 'lapack'
+        # otherwise, perform the full SVD assuming svd_method == 'lapack',
+        # and keep only the leading `n_factors` singular vectors
         else:
             U, S, V = np.linalg.svd(X, full_matrices=False)
+            V = V[:self.n_factors]
 
-        corr_mtx = np.dot(X, V.T)
-        loadings = np.array([[pearsonr(x, c)[0] for c in corr_mtx.T] for x in X.T])
+        # the loadings are the correlations between each (standardized)
+        # variable and each component score; both are centered, so all
+        # of the pearson correlations reduce to a single matrix product
+        scores = np.dot(X, V.T)
+        loadings = np.dot(X.T, scores) / (nrows * scores.std(0))
         return loadings
 
     def _fit_factor_analysis(self, corr_mtx):
@@ -607,6 +695,13 @@ class FactorAnalyzer(BaseEstimator, TransformerMixin):
             If any of the correlations are null, most likely due
             to having zero standard deviation.
         """
+        # make sure there are no null correlations up front, so that
+        # the eigen decompositions inside the optimizer can safely
+        # skip checking their inputs for NaN values on every call
+        if np.isnan(corr_mtx).any():
+            raise ValueError('The correlation matrix cannot have null values. '
+                             'This is most likely because one or more '
+                             'variables have zero standard deviation.')
 
         # if `use_smc` is True, get get squared multiple correlations
         # and use these as initial guesses for optimizer
@@ -615,29 +710,46 @@ class FactorAnalyzer(BaseEstimator, TransformerMixin):
             start = (np.diag(corr_mtx) - smc_mtx.T).squeeze()
         # otherwise, just start with a guess of 0.5 for everything
         else:
-            start = [0.5 for _ in range(corr_mtx.shape[0])]
+            start = np.full(corr_mtx.shape[0], 0.5)
 
-        # if `bounds`, set initial boundaries for all variables;
-        # this must be a list passed to `minimize()`
+        # if `bounds`, set the same initial boundaries for all variables,
+        # using a `Bounds` instance rather than a list of tuples; as
+        # with the tuples, a `None` on either side means no bound
         if self.bounds is not None:
-            bounds = [self.bounds for _ in range(corr_mtx.shape[0])]
+            lower, upper = self.bounds
+            lower = -np.inf if lower is None else lower
+            upper = np.inf if upper is None else upper
+            bounds = Bounds(np.full(corr_mtx.shape[0], lower),
+                            np.full(corr_mtx.shape[0], upper))
         else:
             bounds = self.bounds
 
+        # the MINRES objective overwrites the diagonal of the correlation
+        # matrix on every call, so we allocate a single scratch copy for
+        # the optimizer to work on, rather than mutating `corr_mtx`
+        corr_scratch = corr_mtx.copy()
+
         # minimize the appropriate objective function
         # and the L-BFGS-B algorithm
         if self.method == 'ml' or self.method == 'mle':
             objective = self._fit_ml_objective
+            args = (corr_mtx, self.n_factors)
         elif self.method == 'uls' or self.method == 'minres':
             objective = self._fit_uls_objective
+            # the off-diagonal sum of squares is the same on every
+            # call, so we calculate it once here, rather than each time
+            off_diag_sum_squares = (np.sum(corr_mtx * corr_mtx) -
+                                    np.sum(np.diag(corr_mtx)**2))
+            args = (corr_scratch, self.n_factors, off_diag_sum_squares)
 
         # use scipy to perform the actual minimization
         res = minimize(objective,
                        start,
                        method='L-BFGS-B',
+                       jac=True,
                        bounds=bounds,
                        options={'maxiter': 1000},
-                       args=(corr_mtx, self.n_factors))
+                       args=args)
 
         if not res.success:
             warnings.warn('Failed to converge: {}'.format(res.message))
@@ -645,10 +757,15 @@ class FactorAnalyzer(BaseEstimator, TransformerMixin):
         # transform the final loading matrix (using wls for MINRES,
         # and ml normalization for ML), and convert to DataFrame
         if self.method == 'ml' or self.method == 'mle':
-            loadings = self._normalize_ml(res.x, corr_mtx, self. n_factors)
+            loadings = self._normalize_ml(res.x, corr_mtx, self.n_factors)
         elif self.method == 'uls' or self.method == 'minres':
-            loadings = self._normalize_uls(res.x, corr_mtx, self.n_factors)
-        return loadings
+            loadings = self._normalize_uls(res.x, corr_scratch, self.n_factors)
+
+        # the sign of each eigenvector is arbitrary, so make every column
+        # sum positive here; `fit()` only re-signs more than one factor
+        signs = np.sign(loadings.sum(0))
+        signs[(signs == 0)] = 1
+        return loadings * signs
 
     def fit(self, X, y=None):
         """
@@ -689,11 +806,10 @@ class FactorAnalyzer(BaseEstimator, TransformerMixin):
         self._arg_checker()
 
         # check if the data is a data frame,
-        # so we can convert it to an array
+        # so we can convert it to an array;
+        # `check_array()` will make the copy
         if isinstance(X, pd.DataFrame):
-            X = X.copy().values
-        else:
-            X = X.copy()
+            X = X.values
 
         # now check the array, and make sure it
         # meets all of our expected criteria
@@ -707,16 +823,22 @@ class FactorAnalyzer(BaseEstimator, TransformerMixin):
         if np.isnan(X).any() and not self.is_corr_matrix:
             X = impute_values(X, how=self.impute)
 
-        # get the correlation matrix
+        # get the correlation matrix; the mean and standard
+        # deviation are saved and reused to standardize the data
+        # in `transform()`
         if self.is_corr_matrix:
             corr_mtx = X
         else:
-            corr_mtx = corr(X)
-            self.std_ = np.std(X, axis=0)
             self.mean_ = np.mean(X, axis=0)
+            self.std_ = np.std(X, axis=0)
+            corr_mtx = corr(X, mean=self.mean_, std=self.std_)
+
+        # save the original correlation matrix; this is never
+        # modified in place while fitting the model below
+        self.corr_ = corr_mtx
 
-        # save the original correlation matrix
-        self.corr_ = corr_mtx.copy()
+        # any eigenvalues cached from a previous fit are now stale
+        self._eigenvalues = None
 
         # fit factor analysis model
         if self.method == 'principal':
@@ -757,12 +879,12 @@ class FactorAnalyzer(BaseEstimator, TransformerMixin):
             # this is to ensure that signs align with R
             signs = np.sign(loadings.sum(0))
             signs[(signs == 0)] = 1
-            loadings = np.dot(loadings, np.diag(signs))
+            loadings = loadings * signs
 
             if phi is not None:
                 # update phi, if it exists -- that is, if the rotation is oblique
                 # create the structure matrix for any oblique rotation
-                phi = np.dot(np.dot(np.diag(signs), phi), np.diag(signs))
+                phi = phi * np.outer(signs, signs)
                 structure = np.dot(loadings, phi) if self.rotation in OBLIQUE_ROTATIONS else None
 
         # resort the factors according to their variance,
@@ -818,11 +940,10 @@ class FactorAnalyzer(BaseEstimator, TransformerMixin):
         """
 
         # check if the data is a data frame,
-        # so we can convert it to an array
+        # so we can convert it to an array;
+        # `check_array()` will make the copy
         if isinstance(X, pd.DataFrame):
-            X = X.copy().values
-        else:
-            X = X.copy()
+            X = X.values
 
         # now check the array, and make sure it
         # meets all of our expected criteria
@@ -894,18 +1015,28 @@ class FactorAnalyzer(BaseEstimator, TransformerMixin):
         """
         # meets all of our expected criteria
         check_is_fitted(self, ['loadings_', 'corr_'])
-        corr_mtx = self.corr_.copy()
 
-        e_values, _ = np.linalg.eigh(corr_mtx)
+        # the eigenvalues only depend on the fitted model, so
+        # we compute them once and return copies afterwards
+        if self._eigenvalues is not None:
+            e_values, values = self._eigenvalues
+            return e_values.copy(), values.copy()
+
+        # we only need the eigenvalues, not the eigenvectors
+        e_values = eigh(self.corr_, eigvals_only=True, driver='evd')
         e_values = e_values[::-1]
 
+        # fill the diagonal of a single copy of the correlation matrix
+        # with the communalities, and let LAPACK reuse its buffer
         communalities = self.get_communalities()
-        communalities = communalities.copy()
+        corr_mtx = self.corr_.copy()
         np.fill_diagonal(corr_mtx, communalities)
 
-        values, _ = np.linalg.eigh(corr_mtx)
+        values = eigh(corr_mtx, eigvals_only=True, driver='evd', overwrite_a=True)
         values = values[::-1]
-        return e_values, values
+
+        self._eigenvalues = (e_values, values)
+        return e_values.copy(), values.copy()
 
     def get_communalities(self):
         """
@@ -934,8 +1065,7 @@ class FactorAnalyzer(BaseEstimator, TransformerMixin):
         """
         # meets all of our expected criteria
         check_is_fitted(self, 'loadings_')
-        loadings = self.loadings_.copy()
-        communalities = (loadings ** 2).sum(axis=1)
+        communalities = (self.loadings_ ** 2).sum(axis=1)
         return communalities
 
     def get_uniquenesses(self):
@@ -966,7 +1096,6 @@ class FactorAnalyzer(BaseEstimator, TransformerMixin):
         # meets all of our expected criteria
         check_is_fitted(self, 'loadings_')
         communalities = self.get_communalities()
-        communalities = communalities.copy()
         uniqueness = (1 - communalities)
         return uniqueness
 
@@ -1043,5 +1172,4 @@ class FactorAnalyzer(BaseEstimator, TransformerMixin):
         """
         # meets all of our expected criteria
         check_is_fitted(self, 'loadings_')
-        loadings = self.loadings_.copy()
-        return self._get_factor_variance(loadings)
+        return self._get_factor_variance(self.loadings_)
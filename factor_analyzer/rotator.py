@@ -8,8 +8,9 @@ Class to perform various rotations of factor loading matrices.
 """
 
 import numpy as np
-import scipy as sp
+from scipy.linalg import cho_factor, cho_solve, svd
 from sklearn.base import BaseEstimator
+from sklearn.utils import check_array
 
 ORTHOGONAL_ROTATIONS = ['varimax', 'oblimax', 'quartimax', 'equamax', 'geomin_ort']
 
@@ -134,6 +135,10 @@ class Rotator(BaseEstimator):
         self.rotation_ = None
         self.phi_ = None
 
+        # the most recent varimax result used by promax,
+        # which does not depend on the promax `power`
+        self._varimax_cache = None
+
     def _oblimax_obj(self, loadings):
         """
         The Oblimax function objective.
@@ -176,7 +181,7 @@ class Rotator(BaseEstimator):
                 The value of the criterion for the objective.
         """
         gradient = -loadings**3
-        criterion = -np.sum(np.diag(np.dot((loadings**2).T, loadings**2))) / 4
+        criterion = -np.sum(loadings**4) / 4
         return {'grad': gradient, 'criterion': criterion}
 
     def _oblimin_obj(self, loadings):
@@ -252,10 +257,8 @@ class Rotator(BaseEstimator):
         M = np.ones(p) - np.eye(p)
 
         loadings_squared = loadings**2
-        f1 = (1 - self.kappa) * np.sum(np.diag(np.dot(loadings_squared.T,
-                                                      np.dot(loadings_squared, N)))) / 4
-        f2 = self.kappa * np.sum(np.diag(np.dot(loadings_squared.T,
-                                                np.dot(M, loadings_squared)))) / 4
+        f1 = (1 - self.kappa) * np.sum(loadings_squared * np.dot(loadings_squared, N)) / 4
+        f2 = self.kappa * np.sum(loadings_squared * np.dot(M, loadings_squared)) / 4
 
         gradient = ((1 - self.kappa) * loadings * np.dot(loadings_squared, N) +
                     self.kappa * loadings * np.dot(M, loadings_squared))
@@ -342,10 +345,8 @@ class Rotator(BaseEstimator):
 
         # main iteration loop, up to `max_iter`, calculate the gradient
         for i in range(0, self.max_iter + 1):
-            gradient_new = gradient - np.dot(rotation_matrix,
-                                             np.diag(np.dot(np.ones(gradient.shape[0]),
-                                                            rotation_matrix * gradient)))
-            s = np.sqrt(np.sum(np.diag(np.dot(gradient_new.T, gradient_new))))
+            gradient_new = gradient - rotation_matrix * np.sum(rotation_matrix * gradient, axis=0)
+            s = np.sqrt(np.sum(gradient_new * gradient_new))
 
             if (s < self.tol):
                 break
@@ -356,8 +357,8 @@ class Rotator(BaseEstimator):
             for j in range(0, 11):
                 X = rotation_matrix - alpha * gradient_new
 
-                v = 1 / np.sqrt(np.dot(np.ones(X.shape[0]), X**2))
-                new_rotation_matrix = np.dot(X, np.diag(v))
+                v = 1 / np.sqrt(np.sum(X * X, axis=0))
+                new_rotation_matrix = X * v
                 new_loadings = np.dot(loadings, np.linalg.inv(new_rotation_matrix).T)
 
                 obj_t = objective(new_loadings)
@@ -432,7 +433,7 @@ class Rotator(BaseEstimator):
             M = np.dot(rotation_matrix.T, gradient)
             S = (M + M.T) / 2
             gradient_new = gradient - np.dot(rotation_matrix, S)
-            s = np.sqrt(np.sum(np.diag(np.dot(gradient_new.T, gradient_new))))
+            s = np.sqrt(np.sum(gradient_new * gradient_new))
 
             if (s < self.tol):
                 break
@@ -442,7 +443,7 @@ class Rotator(BaseEstimator):
             # calculate the Hessian of the objective function
             for j in range(0, 11):
                 X = rotation_matrix - alpha * gradient_new
-                U, D, V = np.linalg.svd(X)
+                U, D, V = svd(X, full_matrices=False, check_finite=False, lapack_driver='gesdd')
                 new_rotation_matrix = np.dot(U, V)
                 new_loadings = np.dot(arr, new_rotation_matrix)
 
@@ -461,7 +462,7 @@ class Rotator(BaseEstimator):
         loadings = new_loadings.copy()
         return loadings, rotation_matrix
 
-    def _varimax(self, loadings):
+    def _varimax(self, loadings, normalize=None):
         """
         Perform varimax (orthogonal) rotation, with optional
         Kaiser normalization.
@@ -470,6 +471,10 @@ class Rotator(BaseEstimator):
         ----------
         loadings : array-like
             The loading matrix
+        normalize : bool or None, optional
+            Whether to perform Kaiser normalization.
+            If None, use `self.normalize`.
+            Defaults to None.
 
         Returns
         -------
@@ -478,21 +483,30 @@ class Rotator(BaseEstimator):
         rotation_mtx : numpy array, shape (n_factors, n_factors)
             The rotation matrix
         """
+        if normalize is None:
+            normalize = self.normalize
+
         X = loadings.copy()
         n_rows, n_cols = X.shape
         if n_cols < 2:
             return X
 
-        # normalize the loadings matrix
-        # using sqrt of the sum of squares (Kaiser)
-        if self.normalize:
-            normalized_mtx = np.apply_along_axis(lambda x: np.sqrt(np.sum(x**2)), 1, X.copy())
-            X = (X.T / normalized_mtx).T
+        # normalize the loadings matrix using sqrt of the sum of
+        # squares (Kaiser); the row norms are computed once and
+        # broadcast down the columns, so we can undo it at the end
+        if normalize:
+            normalized_mtx = np.sqrt(np.sum(X * X, axis=1))[:, np.newaxis]
+            X = X / normalized_mtx
 
         # initialize the rotation matrix
         # to N x N identity matrix
         rotation_mtx = np.eye(n_cols)
 
+        # allocate the (n_rows, n_cols) work arrays once, and
+        # fill them in place on every iteration below
+        basis = np.empty((n_rows, n_cols))
+        target = np.empty((n_rows, n_cols))
+
         d = 0
         for _ in range(self.max_iter):
 
@@ -500,16 +514,22 @@ class Rotator(BaseEstimator):
 
             # take inner product of loading matrix
             # and rotation matrix
-            basis = np.dot(X, rotation_mtx)
+            np.dot(X, rotation_mtx, out=basis)
 
             # transform data for singular value decomposition using updated formula :
             # B <- t(x) %*% (z^3 - z %*% diag(drop(rep(1, p) %*% z^2))/p)
-            diagonal = np.diag(np.squeeze(np.repeat(1, n_rows).dot(basis**2)))
-            transformed = X.T.dot(basis**3 - basis.dot(diagonal) / n_rows)
+            # multiplying by a diagonal matrix just scales the columns of z,
+            # so we broadcast the column means of squares instead, and build
+            # the target in place as z * (z^2 - colMeans(z^2))
+            np.multiply(basis, basis, out=target)
+            column_means = np.sum(target, axis=0) / n_rows
+            np.subtract(target, column_means, out=target)
+            np.multiply(target, basis, out=target)
+            transformed = np.dot(X.T, target)
 
             # perform SVD on
             # the transformed matrix
-            U, S, V = np.linalg.svd(transformed)
+            U, S, V = svd(transformed, full_matrices=False, check_finite=False, lapack_driver='gesdd')
 
             # take inner product of U and V, and sum of S
             rotation_mtx = np.dot(U, V)
@@ -521,18 +541,50 @@ class Rotator(BaseEstimator):
 
         # take inner product of loading matrix
         # and rotation matrix
-        X = np.dot(X, rotation_mtx)
+        loadings = np.dot(X, rotation_mtx)
 
         # de-normalize the data
-        if self.normalize:
-            X = X.T * normalized_mtx
-        else:
-            X = X.T
+        if normalize:
+            loadings = loadings * normalized_mtx
 
-        # convert loadings matrix to data frame
-        loadings = X.T.copy()
         return loadings, rotation_mtx
 
+    def _promax_varimax(self, loadings, normalize=None):
+        """
+        Perform the varimax rotation used by promax,
+        reusing the previous result if the loadings
+        and varimax settings have not changed. This
+        avoids repeating the varimax iterations when
+        only the promax `power` changes.
+
+        Parameters
+        ----------
+        loadings : array-like
+            The loading matrix
+        normalize : bool or None, optional
+            Whether to perform Kaiser normalization.
+            If None, use `self.normalize`.
+            Defaults to None.
+
+        Returns
+        -------
+        loadings : numpy array, shape (n_features, n_factors)
+            The loadings matrix
+        rotation_mtx : numpy array, shape (n_factors, n_factors)
+            The rotation matrix
+        """
+        if normalize is None:
+            normalize = self.normalize
+
+        arr = np.asarray(loadings)
+        key = (arr.shape, arr.tobytes(), normalize, self.max_iter, self.tol)
+
+        if self._varimax_cache is None or self._varimax_cache[0] != key:
+            self._varimax_cache = (key, self._varimax(arr, normalize=normalize))
+
+        loadings, rotation_mtx = self._varimax_cache[1]
+        return loadings.copy(), rotation_mtx.copy()
+
     def _promax(self, loadings):
         """
         Perform promax (oblique) rotation, with optional
@@ -562,37 +614,44 @@ class Rotator(BaseEstimator):
         if self.normalize:
             # pre-normalization is done in R's
             # `kaiser()` function when rotate='Promax'.
-            array = X.copy()
-            h2 = sp.diag(np.dot(array, array.T))
+            # the communalities are just the row sums of squares,
+            # so there is no need to form the full `X X'` product
+            h2 = np.sum(X * X, axis=1)
             h2 = np.reshape(h2, (h2.shape[0], 1))
-            weights = array / sp.sqrt(h2)
+            weights = X / np.sqrt(h2)
 
         else:
-            weights = X.copy()
+            weights = X
 
-        # first get varimax rotation
-        X, rotation_mtx = self._varimax(weights)
+        # first get varimax rotation; the rows of `weights` already
+        # have unit length when normalizing, so varimax does not need
+        # to normalize them a second time
+        X, rotation_mtx = self._promax_varimax(weights, normalize=False)
         Y = X * np.abs(X)**(self.power - 1)
 
-        # fit linear regression model
-        coef = np.dot(np.linalg.inv(np.dot(X.T, X)), np.dot(X.T, Y))
+        # fit linear regression model; solve the normal equations
+        # directly, since `X' X` is a small positive definite matrix
+        coef = cho_solve(cho_factor(np.dot(X.T, X)), np.dot(X.T, Y))
 
-        # calculate diagonal of inverse square
+        # calculate diagonal of inverse square; the cross-product is
+        # symmetric positive definite, so we can solve using its cholesky
+        # factor, unless it is singular, in which case use the pseudo-inverse
+        coef_cross = np.dot(coef.T, coef)
         try:
-            diag_inv = sp.diag(sp.linalg.inv(sp.dot(coef.T, coef)))
+            diag_inv = np.diag(cho_solve(cho_factor(coef_cross), np.eye(n_cols)))
         except np.linalg.LinAlgError:
-            diag_inv = sp.diag(sp.linalg.pinv(sp.dot(coef.T, coef)))
+            diag_inv = np.diag(np.linalg.pinv(coef_cross))
 
         # transform and calculate inner products
-        coef = sp.dot(coef, sp.diag(sp.sqrt(diag_inv)))
-        z = sp.dot(X, coef)
+        coef = coef * np.sqrt(diag_inv)
+        z = np.dot(X, coef)
 
         if self.normalize:
             # post-normalization is done in R's
             # `kaiser()` function when rotate='Promax'
-            z = z * sp.sqrt(h2)
+            z = z * np.sqrt(h2)
 
-        rotation_mtx = sp.dot(rotation_mtx, coef)
+        rotation_mtx = np.dot(rotation_mtx, coef)
 
         coef_inv = np.linalg.inv(coef)
         phi = np.dot(coef_inv, coef_inv.T)
@@ -671,6 +730,10 @@ class Rotator(BaseEstimator):
                [ 0.76620579,  0.1045194 , -0.22649615],
                [ 0.81372945,  0.20915845,  0.07479506]])
         """
+        # make sure the loadings are finite up front, since
+        # the rotations skip this check on every iteration
+        X = check_array(X, estimator=self)
+
         # default phi to None
         # it will only be calculated
         # for oblique rotations
@@ -9,7 +9,7 @@ Utility functions, used primarily by the confirmatory factor analysis module.
 import warnings
 
 import numpy as np
-from scipy.linalg import cholesky
+from scipy.linalg import cholesky, solve_triangular
 
 
 def inv_chol(x, logdet=False):
@@ -73,7 +73,7 @@ def cov(x, ddof=0):
     return r
 
 
-def corr(x):
+def corr(x, mean=None, std=None):
     """
     Calculate the correlation matrix.
 
@@ -83,14 +83,37 @@ def corr(x):
         A 1-D or 2-D array containing multiple variables
         and observations. Each column of x represents a variable,
         and each row a single observation of all those variables.
+    mean : array-like, optional
+        The column means of `x`, if they have
+        already been calculated.
+        Defaults to None.
+    std : array-like, optional
+        The column standard deviations of `x` (with
+        ddof=0), if they have already been calculated.
+        Defaults to None.
 
     Returns
     -------
     r : numpy array
         The correlation matrix of the variables.
     """
-    x = (x - x.mean(0)) / x.std(0)
-    r = cov(x)
+    x = np.asarray(x, dtype=float)
+    if x.ndim == 1:
+        x = x[:, np.newaxis]
+
+    if mean is None:
+        mean = x.mean(0)
+
+    # center the data once and take the cross-product; scaling
+    # the result by the inverse column norms gives the correlations
+    # without standardizing (and re-centering) a copy of the data
+    x = x - mean
+    r = np.dot(x.T, x)
+    if std is None:
+        d = 1 / np.sqrt(np.diag(r))
+    else:
+        d = 1 / (np.sqrt(x.shape[0]) * np.asarray(std, dtype=float))
+    r *= np.outer(d, d)
     return r
 
 
@@ -140,9 +163,23 @@ def impute_values(x, how='mean'):
     x : numpy array
         The array, with missing values imputed or dropped.
     """
-    # impute mean or median, if `how` is set to 'mean' or 'median'
-    if how in ['mean', 'median']:
-        x = np.apply_along_axis(apply_impute_nan, 0, x, how=how)
+    # convert any array-like input; this does not copy float arrays,
+    # so those are still filled in place
+    x = np.asarray(x, dtype=float)
+
+    # impute mean or median, if `how` is set to 'mean' or 'median';
+    # we calculate the value for every column at once, and then fill
+    # each missing value with the value for its column; a 1-D array
+    # is a single column, so we just fill it directly
+    if how in ['mean', 'median'] and np.ndim(x) == 1:
+        x = apply_impute_nan(x, how=how)
+    elif how in ['mean', 'median']:
+        if how == 'mean':
+            fill_values = np.nanmean(x, axis=0)
+        else:
+            fill_values = np.nanmedian(x, axis=0)
+        missing_rows, missing_cols = np.where(np.isnan(x))
+        x[missing_rows, missing_cols] = fill_values[missing_cols]
     # drop missing if `how` is set to 'drop'
     elif how == 'drop':
         x = x[~np.isnan(x).any(1), :].copy()
@@ -170,8 +207,17 @@ def smc(corr_mtx, sort=False):
         The squared multiple correlations matrix.
     """
 
-    corr_inv = np.linalg.inv(corr_mtx)
-    smc = 1 - 1 / np.diag(corr_inv)
+    # we only need the diagonal of the inverse, which is the column-wise
+    # sum of squares of the inverted Cholesky factor; if the matrix is
+    # not positive definite, fall back to the full inverse instead
+    try:
+        chol = cholesky(corr_mtx, lower=True)
+        chol_inv = solve_triangular(chol, np.eye(chol.shape[0]), lower=True)
+        corr_inv_diag = np.sum(chol_inv * chol_inv, axis=0)
+    except np.linalg.LinAlgError:
+        corr_inv_diag = np.diag(np.linalg.inv(corr_mtx))
+
+    smc = 1 - 1 / corr_inv_diag
 
     if sort:
         smc = np.sort(smc)
@@ -6,7 +6,12 @@ Tests for Rotator class
 :organization: ETS
 """
 
-from factor_analyzer.test_utils import check_rotation
+from unittest import mock
+
+from numpy.testing import assert_array_almost_equal
+
+from factor_analyzer import Rotator
+from factor_analyzer.test_utils import check_rotation, collect_r_output, normalize
 
 # set a threshold of roughly 95 percent matching
 THRESHOLD = 0.95
@@ -248,4 +253,27 @@ def test_02_geomin_ort_ml_3_factors():
     rotation = 'geomin_ort'
 
     check = check_rotation(test_name, factors, method, rotation)
-    assert check == 1
\ No newline at end of file
+    assert check == 1
+
+
+def test_02_promax_reused_for_different_powers():
+
+    r_input = collect_r_output('test02', 3, 'uls', 'none', output_types=['loading'])
+    r_loading = normalize(r_input['loading'], absolute=False)
+
+    # the varimax step should only run once, since
+    # only the promax power changes between the two fits
+    with mock.patch.object(Rotator, '_varimax', autospec=True,
+                           side_effect=Rotator._varimax) as varimax:
+        rotator = Rotator(method='promax', power=2)
+        rotator.fit(r_loading)
+        rotator.set_params(power=4)
+        rotated_loading = rotator.fit_transform(r_loading)
+
+    assert varimax.call_count == 1
+
+    expected = Rotator(method='promax', power=4)
+    expected_loading = expected.fit_transform(r_loading)
+
+    assert_array_almost_equal(rotated_loading, expected_loading)
+    assert_array_almost_equal(rotator.phi_, expected.phi_)
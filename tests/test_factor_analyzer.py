@@ -6,12 +6,17 @@ Tests for FactorAnalyzer class
 :organization: ETS
 """
 
+import warnings
+from unittest import mock
+
 import numpy as np
 import pandas as pd
 
 from nose.tools import raises
-from numpy.testing import assert_array_almost_equal
+from numpy.testing import assert_array_almost_equal, assert_array_equal
 from pandas.util.testing import assert_almost_equal
+from scipy.linalg import eigh
+from scipy.optimize import check_grad
 
 from sklearn.model_selection import GridSearchCV
 from sklearn.pipeline import make_pipeline
@@ -33,6 +38,40 @@ def test_calculate_bartlett_sphericity():
     assert_almost_equal(p, 0)
 
 
+def test_calculate_bartlett_sphericity_singular():
+
+    path = 'tests/data/test01.csv'
+    data = pd.read_csv(path).iloc[:, :3]
+
+    # a duplicated column makes the correlation matrix exactly singular,
+    # so the data is clearly not spherical
+    data['duplicate'] = data.iloc[:, 0]
+    s, p = calculate_bartlett_sphericity(data.values)
+
+    assert s == np.inf
+    assert p == 0
+
+
+def test_calculate_bartlett_sphericity_indefinite():
+
+    path = 'tests/data/test01.csv'
+    data = pd.read_csv(path).iloc[:, :3]
+
+    # this matrix has a negative determinant, so the statistic is undefined
+    indefinite = np.array([[1.0, 0.9, 0.9],
+                           [0.9, 1.0, -0.9],
+                           [0.9, -0.9, 1.0]])
+
+    with mock.patch('factor_analyzer.factor_analyzer.corr', return_value=indefinite):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            s, p = calculate_bartlett_sphericity(data.values)
+
+    assert np.isnan(s)
+    assert np.isnan(p)
+    assert len(caught) == 1
+
+
 def test_calculate_kmo():
 
     path = 'tests/data/test02.csv'
@@ -54,6 +93,26 @@ def test_calculate_kmo():
     assert_almost_equal(kmo_overall, expected_overall)
 
 
+def test_calculate_kmo_bartlett_data_frame():
+
+    path = 'tests/data/test02.csv'
+    data = pd.read_csv(path)
+
+    # data frames and arrays should give the same statistics
+    kmo_by_item, kmo_overall = calculate_kmo(data)
+    expected_by_item, expected_overall = calculate_kmo(data.values)
+
+    assert_almost_equal(kmo_by_item, expected_by_item)
+    assert_almost_equal(kmo_overall, expected_overall)
+    assert_almost_equal(kmo_overall, 0.81498469767761361)
+
+    s, p = calculate_bartlett_sphericity(data)
+    s_expected, p_expected = calculate_bartlett_sphericity(data.values)
+
+    assert_almost_equal(s, s_expected)
+    assert_almost_equal(p, p_expected)
+
+
 def test_gridsearch():
     # make sure this doesn't fail
 
@@ -163,6 +222,16 @@ class TestFactorAnalyzer:
         fa = FactorAnalyzer(impute='drop', n_factors=1, is_corr_matrix=True)
         fa.fit(data)
 
+    @raises(ValueError)
+    def test_analyze_zero_std(self):
+
+        data = pd.DataFrame({'A': [2, 4, 5, 6, 8, 9],
+                             'B': [1, 1, 1, 1, 1, 1],
+                             'C': [6, 12, 15, 12, 26, 27]})
+
+        fa = FactorAnalyzer(rotation=None, n_factors=1)
+        fa.fit(data)
+
     def test_smc_is_r_squared(self):
         # test that SMC is roughly equivalent to R-squared values.
 
@@ -177,6 +246,20 @@ class TestFactorAnalyzer:
 
         assert_array_almost_equal(smc_result, expected_r2)
 
+    def test_smc_not_positive_definite(self):
+        # test that SMC falls back to the full inverse
+        # when the matrix is not positive definite
+
+        corr_mtx = np.array([[1.0, 0.9, 0.1],
+                             [0.9, 1.0, 0.9],
+                             [0.1, 0.9, 1.0]])
+
+        expected = 1 - 1 / np.diag(np.linalg.inv(corr_mtx))
+
+        smc_result = smc(corr_mtx)
+
+        assert_array_almost_equal(smc_result, expected)
+
     def test_factor_variance(self):
 
         path = 'tests/data/test01.csv'
@@ -197,3 +280,129 @@ class TestFactorAnalyzer:
         proportional_variance = fa.get_factor_variance()[1]
 
         assert_almost_equal(proportional_variance_expected, proportional_variance)
+
+    def test_eigenvalues_refit(self):
+
+        path = 'tests/data/test01.csv'
+        data = pd.read_csv(path)
+
+        fa = FactorAnalyzer(n_factors=3, rotation=None)
+        fa.fit(data)
+        first = fa.get_eigenvalues()
+
+        # the cached eigenvalues should be recomputed after refitting
+        fa.fit(data.iloc[:, :5])
+        second = fa.get_eigenvalues()
+
+        fa_expected = FactorAnalyzer(n_factors=3, rotation=None)
+        fa_expected.fit(data.iloc[:, :5])
+        expected = fa_expected.get_eigenvalues()
+
+        assert len(first[0]) != len(second[0])
+        assert_array_almost_equal(second[0], expected[0])
+        assert_array_almost_equal(second[1], expected[1])
+
+    def test_principal_lapack_n_factors(self):
+
+        path = 'tests/data/test01.csv'
+        data = pd.read_csv(path)
+
+        fa_lapack = FactorAnalyzer(n_factors=3, rotation=None, method='principal',
+                                   svd_method='lapack')
+        fa_lapack.fit(data)
+
+        fa_auto = FactorAnalyzer(n_factors=3, rotation=None, method='principal',
+                                 svd_method='auto')
+        fa_auto.fit(data)
+
+        assert fa_lapack.loadings_.shape == (data.shape[1], 3)
+        assert_array_almost_equal(np.abs(fa_lapack.loadings_),
+                                  np.abs(fa_auto.loadings_))
+
+        # with 10 columns, 3 factors is at least 10% of
+        # min(n, p), so 'auto' should take the lapack branch
+        path = 'tests/data/test02.csv'
+        data = pd.read_csv(path)
+
+        fa_lapack = FactorAnalyzer(n_factors=3, rotation=None, method='principal',
+                                   svd_method='lapack')
+        fa_lapack.fit(data)
+
+        fa_auto = FactorAnalyzer(n_factors=3, rotation=None, method='principal',
+                                 svd_method='auto')
+        fa_auto.fit(data)
+
+        assert_array_equal(fa_auto.loadings_, fa_lapack.loadings_)
+
+    def test_analyze_one_sided_bounds(self):
+
+        path = 'tests/data/test01.csv'
+        data = pd.read_csv(path)
+
+        fa = FactorAnalyzer(n_factors=3, rotation=None, bounds=(0.005, None))
+        fa.fit(data)
+
+        fa_expected = FactorAnalyzer(n_factors=3, rotation=None, bounds=(0.005, 1))
+        fa_expected.fit(data)
+
+        assert_array_almost_equal(fa.loadings_, fa_expected.loadings_)
+
+    def test_analyze_one_factor_sign(self):
+
+        path = 'tests/data/test01.csv'
+        data = pd.read_csv(path)
+
+        # with a single factor, the loadings are not re-signed after
+        # fitting, so the normalization must fix the sign itself
+        fa_minres = FactorAnalyzer(n_factors=1, rotation=None, method='minres')
+        fa_minres.fit(data)
+        assert_array_almost_equal(fa_minres.loadings_.sum(), 23.558, decimal=3)
+
+        fa_ml = FactorAnalyzer(n_factors=1, rotation=None, method='ml')
+        fa_ml.fit(data)
+        assert_array_almost_equal(fa_ml.loadings_.sum(), 23.084, decimal=3)
+
+    def test_objective_gradients(self):
+
+        path = 'tests/data/test01.csv'
+        data = pd.read_csv(path)
+        corr_mtx = data.corr().values
+        psi = 1 - smc(corr_mtx)
+
+        uls = FactorAnalyzer._fit_uls_objective
+        ml = FactorAnalyzer._fit_ml_objective
+
+        # compare the analytic gradients against finite differences;
+        # the ULS objective overwrites the diagonal, so give it a copy
+        for n_factors in range(1, 4):
+            corr_scratch = corr_mtx.copy()
+            error = check_grad(lambda x: uls(x, corr_scratch, n_factors)[0],
+                               lambda x: uls(x, corr_scratch, n_factors)[1],
+                               psi)
+            assert error / np.linalg.norm(uls(psi, corr_scratch, n_factors)[1]) < 1e-3
+
+            error = check_grad(lambda x: ml(x, corr_mtx, n_factors)[0],
+                               lambda x: ml(x, corr_mtx, n_factors)[1],
+                               psi)
+            assert error / np.linalg.norm(ml(psi, corr_mtx, n_factors)[1]) < 1e-3
+
+    def test_top_eigh(self):
+
+        path = 'tests/data/test02.csv'
+        data = pd.read_csv(path)
+        corr_mtx = data.corr().values
+        n_rows = corr_mtx.shape[0]
+
+        expected_values, expected_vectors = eigh(corr_mtx)
+        expected_values = expected_values[::-1]
+        expected_vectors = expected_vectors[:, ::-1]
+
+        # more factors than rows should give back every eigenpair
+        for n_factors in [3, n_rows, n_rows + 2]:
+            n_eigen = min(n_factors, n_rows)
+            values, vectors = FactorAnalyzer._top_eigh(corr_mtx, n_factors)
+
+            assert vectors.shape == (n_rows, n_eigen)
+            assert_array_almost_equal(values, expected_values[:n_eigen])
+            assert_array_almost_equal(np.abs(vectors),
+                                      np.abs(expected_vectors[:, :n_eigen]))
@@ -8,7 +8,8 @@ Tests utilities.
 
 import numpy as np
 import pandas as pd
-from factor_analyzer.utils import (covariance_to_correlation,
+from factor_analyzer.utils import (corr,
+                                   covariance_to_correlation,
                                    duplication_matrix,
                                    duplication_matrix_pre_post,
                                    commutation_matrix,
@@ -17,6 +18,7 @@ from factor_analyzer.utils import (covariance_to_correlation,
                                    get_free_parameter_idxs,
                                    get_symmetric_lower_idxs,
                                    get_symmetric_upper_idxs,
+                                   impute_values,
                                    merge_variance_covariance,
                                    partial_correlations,
                                    unique_elements)
@@ -44,6 +46,60 @@ def test_fill_lower_diag():
     assert_array_equal(output, expected)
 
 
+def test_impute_values_mean():
+
+    expected = np.array([[1, 6],
+                         [3, 4],
+                         [2, 8]])
+
+    x = np.array([[1, np.nan],
+                  [3, 4],
+                  [np.nan, 8]])
+    output = impute_values(x, how='mean')
+    assert_array_equal(output, expected)
+
+
+def test_impute_values_median():
+
+    expected = np.array([[1, 4],
+                         [3, 4],
+                         [2, 8],
+                         [2, 2]])
+
+    x = np.array([[1, np.nan],
+                  [3, 4],
+                  [np.nan, 8],
+                  [2, 2]])
+    output = impute_values(x, how='median')
+    assert_array_equal(output, expected)
+
+
+def test_impute_values_1d():
+
+    data = np.array([1., np.nan, 3.])
+
+    expected = np.array([1., 2., 3.])
+    output = impute_values(data, how='mean')
+
+    assert_array_equal(output, expected)
+
+
+def test_impute_values_list():
+
+    expected = np.array([[1, 6],
+                         [3, 4],
+                         [2, 8]])
+
+    x = [[1, np.nan],
+         [3, 4],
+         [np.nan, 8]]
+    output = impute_values(x, how='mean')
+    assert_array_equal(output, expected)
+
+    output = impute_values([1., np.nan, 3.], how='mean')
+    assert_array_equal(output, np.array([1., 2., 3.]))
+
+
 def test_merge_variance_covariance_no_covariance():
 
     expected = np.eye(4)
@@ -189,6 +245,25 @@ def test_covariance_to_correlation():
     assert_almost_equal(corr, expected_corr)
 
 
+def test_corr():
+
+    path = 'tests/data/test02.csv'
+    data = pd.read_csv(path)
+
+    expected_corr = data.corr().values
+
+    assert_almost_equal(corr(data.values), expected_corr)
+
+    # precomputed means and standard deviations give the same result
+    assert_almost_equal(corr(data.values,
+                             mean=data.values.mean(0),
+                             std=data.values.std(0)),
+                        expected_corr)
+
+    # a data frame gives the same result as its values
+    assert_almost_equal(corr(data), expected_corr)
+
+
 @raises(ValueError)
 def test_covariance_to_correlation_value_error():
 